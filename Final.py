@@ -1,4 +1,6 @@
+import heapq
 import sqlite3
+import time
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
 import webbrowser
@@ -6,6 +8,30 @@ import os
 from PIL import Image, ImageTk
 
 
+def normalize_isbn(isbn):
+    """Return the canonical ISBN-13 of an ISBN-10 or ISBN-13 as an int, or None if it is invalid."""
+    digits = str(isbn).replace("-", "").replace(" ", "").upper()
+    if not digits.isascii():
+        return None
+
+    if len(digits) == 10:
+        if not digits[:9].isdigit() or not (digits[9].isdigit() or digits[9] == "X"):
+            return None
+        check = 10 if digits[9] == "X" else int(digits[9])
+        if (sum((10 - i) * int(d) for i, d in enumerate(digits[:9])) + check) % 11:
+            return None
+        digits = "978" + digits[:9]
+        digits += str(-sum((3 if i % 2 else 1) * int(d) for i, d in enumerate(digits)) % 10)
+        return int(digits)
+
+    if len(digits) == 13 and digits.isdigit() and digits[:3] in ("978", "979"):
+        if sum((3 if i % 2 else 1) * int(d) for i, d in enumerate(digits)) % 10:
+            return None
+        return int(digits)
+
+    return None
+
+
 class Book:
     def __init__(self, title, author, isbn, pdf_path=None):
         self.title = title
@@ -16,13 +42,17 @@ class Book:
 
 
 class Library:
-    def __init__(self):
+    def __init__(self, db_path="library_management.db"):
         self.head = None
+        self.book_index = {}
         self.undo_stack = []
+        self.db_path = db_path
+        self.circulation = None
+        self.unmigrated_books = 0
         self.create_table()
 
     def connect_db(self):
-        return sqlite3.connect("library_management.db")
+        return sqlite3.connect(self.db_path)
 
     def create_table(self):
         conn = self.connect_db()
@@ -32,15 +62,113 @@ class Library:
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             author TEXT NOT NULL,
-            isbn TEXT NOT NULL UNIQUE,
+            isbn INTEGER NOT NULL UNIQUE,
             pdf_path TEXT
         );
         '''
-        cursor.execute(create_table_sql)
+        cursor.execute("PRAGMA table_info(books)")
+        columns = {row[1]: row[2] for row in cursor.fetchall()}
+        if columns.get("isbn", "").upper() == "TEXT":
+            self.migrate_isbn_column(conn, create_table_sql)
+        else:
+            cursor.execute(create_table_sql)
+            conn.commit()
+        conn.close()
+        self.unmigrated_books = len(self.get_unmigrated_books())
+
+    def migrate_isbn_column(self, conn, create_table_sql):
+        # Rebuild the TEXT-keyed books table with canonical ISBN-13 integer keys.
+        # Rows that normalize to an ISBN already taken are merged into the first
+        # row; rows whose ISBN fails validation keep their id in books_unmigrated
+        # so they can be fixed by hand.
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute("ALTER TABLE books RENAME TO books_text_isbn")
+            cursor.execute(create_table_sql)
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS books_unmigrated (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                author TEXT NOT NULL,
+                isbn TEXT NOT NULL,
+                pdf_path TEXT
+            );
+            ''')
+            cursor.execute("SELECT id, title, author, isbn, pdf_path FROM books_text_isbn ORDER BY id")
+            migrated = {}
+            for book_id, title, author, isbn, pdf_path in cursor.fetchall():
+                key = normalize_isbn(isbn)
+                if key is None:
+                    cursor.execute("INSERT INTO books_unmigrated (id, title, author, isbn, pdf_path) "
+                                   "VALUES (?, ?, ?, ?, ?)", (book_id, title, author, isbn, pdf_path))
+                elif key in migrated:
+                    kept_id, kept_pdf_path = migrated[key]
+                    if pdf_path and not kept_pdf_path:
+                        cursor.execute("UPDATE books SET pdf_path=? WHERE id=?", (pdf_path, kept_id))
+                        migrated[key] = (kept_id, pdf_path)
+                else:
+                    cursor.execute("INSERT INTO books (id, title, author, isbn, pdf_path) VALUES (?, ?, ?, ?, ?)",
+                                   (book_id, title, author, key, pdf_path))
+                    migrated[key] = (book_id, pdf_path)
+            cursor.execute("DROP TABLE books_text_isbn")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def get_unmigrated_books(self):
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='books_unmigrated'")
+        if not cursor.fetchone():
+            conn.close()
+            return []
+        cursor.execute("SELECT id, title, author, isbn, pdf_path FROM books_unmigrated ORDER BY id")
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+
+    def restore_unmigrated_book(self, book_id, isbn):
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT title, author, pdf_path FROM books_unmigrated WHERE id=?", (book_id,))
+        row = cursor.fetchone()
+        conn.close()
+        if not row:
+            return None
+
+        new_book = self.add_book(row[0], row[1], isbn, row[2])
+        if new_book:
+            conn = self.connect_db()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM books_unmigrated WHERE id=?", (book_id,))
+            conn.commit()
+            conn.close()
+            self.unmigrated_books -= 1
+        return new_book
+
+    def discard_unmigrated_book(self, book_id):
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM books_unmigrated WHERE id=?", (book_id,))
         conn.commit()
+        discarded = cursor.rowcount
         conn.close()
+        self.unmigrated_books -= discarded
+        return discarded > 0
+
+    def validate_isbn(self, isbn):
+        key = normalize_isbn(isbn)
+        if key is None:
+            messagebox.showerror("Error", f'Invalid ISBN: "{isbn}". Enter a valid ISBN-10 or ISBN-13.')
+        return key
+
+    def add_book(self, title, author, isbn, pdf_path=None):
+        isbn = self.validate_isbn(isbn)
+        if isbn is None:
+            return
 
-    def add_book(self, title, author, isbn):
         conn = self.connect_db()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM books WHERE isbn=?", (isbn,))
@@ -51,7 +179,8 @@ class Library:
             messagebox.showerror("Error", f'Book with ISBN "{isbn}" already exists.')
             return
 
-        new_book = Book(title, author, isbn)
+        new_book = Book(title, author, isbn, pdf_path)
+        self.book_index[isbn] = new_book
         if not self.head:
             self.head = new_book
         else:
@@ -63,16 +192,28 @@ class Library:
         conn = self.connect_db()
         cursor = conn.cursor()
         try:
-            cursor.execute("INSERT INTO books (title, author, isbn) VALUES (?, ?, ?)", (title, author, isbn))
+            cursor.execute("INSERT INTO books (title, author, isbn, pdf_path) VALUES (?, ?, ?, ?)",
+                           (title, author, isbn, pdf_path))
             conn.commit()
             self.undo_stack.append(("add", new_book))
             messagebox.showinfo("Success", f'Book "{title}" added successfully.')
+            return new_book
         except sqlite3.IntegrityError:
             messagebox.showerror("Error", f'Book with ISBN "{isbn}" already exists.')
         finally:
             conn.close()
 
+    def is_on_loan(self, isbn):
+        return self.circulation is not None and isbn in self.circulation.active_loans
+
     def delete_book(self, isbn):
+        isbn = self.validate_isbn(isbn)
+        if isbn is None:
+            return
+        if self.is_on_loan(isbn):
+            messagebox.showerror("Error", f'Book with ISBN "{isbn}" is checked out and cannot be deleted.')
+            return
+
         current = self.head
         previous = None
         while current:
@@ -81,6 +222,7 @@ class Library:
                     previous.next = current.next
                 else:
                     self.head = current.next
+                self.book_index.pop(isbn, None)
 
                 conn = self.connect_db()
                 cursor = conn.cursor()
@@ -97,11 +239,16 @@ class Library:
         messagebox.showwarning("Not Found", "Book not found!")
 
     def upload_pdf(self, isbn):
+        isbn = self.validate_isbn(isbn)
+        if isbn is None:
+            return
+
         conn = self.connect_db()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM books WHERE isbn=?", (isbn,))
         result = cursor.fetchone()
         if result[0] == 0:
+            conn.close()
             messagebox.showerror("Error", f"Incorrect ISBN: {isbn}. Book not found.")
             return
         pdf_path = filedialog.askopenfilename(title="Select PDF File", filetypes=[("PDF Files", "*.pdf")])
@@ -114,6 +261,10 @@ class Library:
             conn.close()
 
     def view_pdf(self, isbn):
+        isbn = self.validate_isbn(isbn)
+        if isbn is None:
+            return
+
         conn = self.connect_db()
         cursor = conn.cursor()
         cursor.execute("SELECT pdf_path FROM books WHERE isbn=?", (isbn,))
@@ -129,12 +280,18 @@ class Library:
             messagebox.showwarning("Undo", "No operations to undo!")
             return
 
-        operation = self.undo_stack.pop()
+        operation = self.undo_stack[-1]
+        if operation[0] == "add" and self.is_on_loan(operation[1].isbn):
+            messagebox.showerror("Undo", f'Book with ISBN "{operation[1].isbn}" is checked out; '
+                                         f'check it in before undoing its addition.')
+            return
+
+        self.undo_stack.pop()
         if operation[0] == "add":
             self.delete_book(operation[1].isbn)
         elif operation[0] == "delete":
             self.add_book(operation[1].title, operation[1].author,
-                          operation[1].isbn)
+                          operation[1].isbn, operation[1].pdf_path)
 
     def view_books(self):
         conn = self.connect_db()
@@ -328,12 +485,15 @@ class Library:
             </style>
             <script>
                 function searchBooks() {
-                    const input = document.getElementById('isbnSearch').value.toLowerCase();
+                    // ISBNs are stored as ISBN-13; an ISBN-10 query is matched by its
+                    // 978-prefixed form, which drops the ISBN-10 check digit.
+                    const input = document.getElementById('isbnSearch').value.replace(/[- ]/g, '').toUpperCase();
+                    const isbn13Prefix = input.length === 10 ? '978' + input.slice(0, 9) : null;
                     const rows = document.querySelectorAll('table tbody tr');
 
                     rows.forEach(row => {
-                        const isbnCell = row.cells[2].textContent.toLowerCase();
-                        if (isbnCell.includes(input)) {
+                        const isbnCell = row.cells[2].textContent;
+                        if (isbnCell.includes(input) || (isbn13Prefix && isbnCell.startsWith(isbn13Prefix))) {
                             row.style.display = '';
                         } else {
                             row.style.display = 'none';
@@ -347,7 +507,7 @@ class Library:
                 <h1>Library Books Collection</h1>
                 <div class="header">
                     <div class="search-container">
-                        <input type="text" id="isbnSearch" class="search-input" placeholder="Search by ISBN..." onkeyup="searchBooks()">
+                        <input type="text" id="isbnSearch" class="search-input" placeholder="Search by ISBN-10 or ISBN-13..." onkeyup="searchBooks()">
                     </div>
                 </div>
                 <table>
@@ -398,28 +558,55 @@ class Library:
         cursor.execute("SELECT title, author, isbn, pdf_path FROM books")
         rows = cursor.fetchall()
 
+        tail = self.head
+        while tail and tail.next:
+            tail = tail.next
+
         for row in rows:
             new_book = Book(row[0], row[1], row[2], row[3])
+            self.book_index[new_book.isbn] = new_book
             if not self.head:
                 self.head = new_book
             else:
-                current = self.head
-                while current.next:
-                    current = current.next
-                current.next = new_book
+                tail.next = new_book
+            tail = new_book
 
         conn.close()
 
     def update_book(self, isbn, title, author, new_isbn):
+        isbn = self.validate_isbn(isbn)
+        new_isbn = self.validate_isbn(new_isbn)
+        if isbn is None or new_isbn is None:
+            return
+        if new_isbn != isbn and self.is_on_loan(isbn):
+            messagebox.showerror("Error", f'Book with ISBN "{isbn}" is checked out; check it in before changing its ISBN.')
+            return
+
         conn = self.connect_db()
         cursor = conn.cursor()
-        cursor.execute("UPDATE books SET title=?, author=?, isbn=? WHERE isbn=?",
-                       (title, author, new_isbn, isbn))
-        conn.commit()
-        conn.close()
+        try:
+            cursor.execute("UPDATE books SET title=?, author=?, isbn=? WHERE isbn=?",
+                           (title, author, new_isbn, isbn))
+            conn.commit()
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Error", f'Book with ISBN "{new_isbn}" already exists.')
+            return
+        finally:
+            conn.close()
+
+        current = self.book_index.pop(isbn, None)
+        if current:
+            current.title = title
+            current.author = author
+            current.isbn = new_isbn
+            self.book_index[new_isbn] = current
         messagebox.showinfo("Success", f'Book with ISBN "{isbn}" updated successfully.')
 
     def get_book_by_isbn(self, isbn):
+        isbn = normalize_isbn(isbn)
+        if isbn is None:
+            return None
+
         conn = self.connect_db()
         cursor = conn.cursor()
         cursor.execute("SELECT title, author, isbn FROM books WHERE isbn=?", (isbn,))
@@ -428,18 +615,223 @@ class Library:
         return book if book else None
 
 
+class Loan:
+    def __init__(self, loan_id, isbn, member_id, checkout_time, due_time, returned_time=None):
+        self.loan_id = loan_id
+        self.isbn = isbn
+        self.member_id = member_id
+        self.checkout_time = checkout_time
+        self.due_time = due_time
+        self.returned_time = returned_time
+
+
+class Circulation:
+    def __init__(self, library, loan_days=14, batch_size=50):
+        self.library = library
+        self.loan_days = loan_days
+        self.batch_size = batch_size
+        self.active_loans = {}
+        self.member_loans = {}
+        self.due_heap = []
+        self.stale_entries = 0
+        self.pending_writes = []
+        self.next_loan_id = 1
+        library.circulation = self
+        self.create_table()
+        self.load_loans_from_db()
+
+    def create_table(self):
+        conn = self.library.connect_db()
+        cursor = conn.cursor()
+        create_table_sql = '''
+        CREATE TABLE IF NOT EXISTS loans (
+            id INTEGER PRIMARY KEY,
+            isbn INTEGER NOT NULL,
+            member_id TEXT NOT NULL,
+            checkout_time REAL NOT NULL,
+            due_time REAL NOT NULL,
+            returned_time REAL
+        );
+        '''
+        cursor.execute(create_table_sql)
+        cursor.execute("CREATE INDEX IF NOT EXISTS loans_isbn ON loans (isbn)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS loans_member ON loans (member_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS loans_due ON loans (due_time) WHERE returned_time IS NULL")
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS loans_active_isbn ON loans (isbn) WHERE returned_time IS NULL")
+        conn.commit()
+        conn.close()
+
+    def load_loans_from_db(self):
+        conn = self.library.connect_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM loans")
+        self.next_loan_id = cursor.fetchone()[0]
+        cursor.execute("SELECT id, isbn, member_id, checkout_time, due_time FROM loans "
+                       "WHERE returned_time IS NULL")
+        rows = cursor.fetchall()
+        conn.close()
+
+        for row in rows:
+            loan = Loan(*row)
+            self.active_loans[loan.isbn] = loan
+            self.member_loans.setdefault(loan.member_id, {})[loan.isbn] = loan
+            self.due_heap.append((loan.due_time, loan.loan_id, loan))
+        heapq.heapify(self.due_heap)
+
+    def track_loan(self, loan):
+        self.active_loans[loan.isbn] = loan
+        self.member_loans.setdefault(loan.member_id, {})[loan.isbn] = loan
+        heapq.heappush(self.due_heap, (loan.due_time, loan.loan_id, loan))
+
+    def untrack_loan(self, loan):
+        del self.active_loans[loan.isbn]
+        member_loans = self.member_loans[loan.member_id]
+        del member_loans[loan.isbn]
+        if not member_loans:
+            del self.member_loans[loan.member_id]
+
+    def queue_write(self, sql, params, loan):
+        # Loans live in memory; the database is brought up to date in batches.
+        self.pending_writes.append((sql, params, loan))
+        if len(self.pending_writes) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        # A write the database rejects (e.g. another instance already lent the book)
+        # is dropped along with the rest of its loan's writes and reconciled below.
+        # Any other failure rolls the batch back and keeps it for the next flush.
+        if not self.pending_writes:
+            return True
+        rejected = []
+        conn = self.library.connect_db()
+        cursor = conn.cursor()
+        try:
+            for sql, params, loan in self.pending_writes:
+                if loan in rejected:
+                    continue
+                try:
+                    cursor.execute(sql, params)
+                except sqlite3.IntegrityError:
+                    rejected.append(loan)
+            conn.commit()
+            self.pending_writes = []
+        except sqlite3.Error as e:
+            conn.rollback()
+            messagebox.showerror("Error", f"Could not save {len(self.pending_writes)} loan change(s): {e}")
+            return False
+        finally:
+            conn.close()
+
+        if rejected:
+            self.reconcile_loans(rejected)
+            messagebox.showerror("Error", "These loans conflicted with the database and were discarded:\n" +
+                                 "\n".join(f"ISBN {loan.isbn} to {loan.member_id}" for loan in rejected))
+        return True
+
+    def reconcile_loans(self, rejected):
+        # Undo the rejected loans in memory and pick up whatever the database holds instead.
+        conn = self.library.connect_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM loans")
+        self.next_loan_id = max(self.next_loan_id, cursor.fetchone()[0])
+        for loan in rejected:
+            if self.active_loans.get(loan.isbn) is loan:
+                self.untrack_loan(loan)
+            if loan.returned_time is None:
+                loan.returned_time = loan.checkout_time
+                self.stale_entries += 1
+            if loan.isbn not in self.active_loans:
+                cursor.execute("SELECT id, isbn, member_id, checkout_time, due_time FROM loans "
+                               "WHERE isbn=? AND returned_time IS NULL", (loan.isbn,))
+                row = cursor.fetchone()
+                if row:
+                    self.track_loan(Loan(*row))
+        conn.close()
+
+    def checkout(self, isbn, member_id, now=None):
+        isbn = self.library.validate_isbn(isbn)
+        if isbn is None:
+            return None
+        if isbn not in self.library.book_index:
+            messagebox.showerror("Error", f"Incorrect ISBN: {isbn}. Book not found.")
+            return None
+        if isbn in self.active_loans:
+            messagebox.showerror("Error", f'Book with ISBN "{isbn}" is already checked out.')
+            return None
+
+        now = time.time() if now is None else now
+        loan = Loan(self.next_loan_id, isbn, member_id, now, now + self.loan_days * 86400)
+        self.next_loan_id += 1
+        self.track_loan(loan)
+        self.queue_write("INSERT INTO loans (id, isbn, member_id, checkout_time, due_time) VALUES (?, ?, ?, ?, ?)",
+                         (loan.loan_id, isbn, member_id, loan.checkout_time, loan.due_time), loan)
+        return loan
+
+    def checkin(self, isbn, now=None):
+        isbn = self.library.validate_isbn(isbn)
+        if isbn is None:
+            return None
+        loan = self.active_loans.get(isbn)
+        if loan is None:
+            messagebox.showwarning("Not Found", f'Book with ISBN "{isbn}" is not checked out.')
+            return None
+
+        loan.returned_time = time.time() if now is None else now
+        self.untrack_loan(loan)
+
+        # Returned loans stay in the heap until popped; rebuild it once they dominate.
+        self.stale_entries += 1
+        if self.stale_entries > len(self.due_heap) // 2:
+            self.due_heap = [(active.due_time, active.loan_id, active)
+                             for active in self.active_loans.values()]
+            heapq.heapify(self.due_heap)
+            self.stale_entries = 0
+
+        self.queue_write("UPDATE loans SET returned_time=? WHERE id=?", (loan.returned_time, loan.loan_id), loan)
+        return loan
+
+    def loans_for_member(self, member_id):
+        return list(self.member_loans.get(member_id, {}).values())
+
+    def overdue_loans(self, now=None):
+        # Pop only the entries already past due, then push the live ones back:
+        # O(k log n) for k overdue loans instead of a scan over every loan.
+        now = time.time() if now is None else now
+        overdue = []
+        while self.due_heap and self.due_heap[0][0] < now:
+            entry = heapq.heappop(self.due_heap)
+            if entry[2].returned_time is None:
+                overdue.append(entry)
+            else:
+                self.stale_entries -= 1
+        for entry in overdue:
+            heapq.heappush(self.due_heap, entry)
+        return [entry[2] for entry in overdue]
+
+
 class LibraryApp:
     def __init__(self, root):
         self.library = Library()
         self.library.load_books_from_db()
+        # Desk transactions arrive at human speed, so write each one through.
+        self.circulation = Circulation(self.library, batch_size=1)
 
         self.window = root
         self.window.title("LIBRARY MANAGEMENT SYSTEM")
         self.window.geometry("1920x1080")
         self.window.config(bg="#f0f0f0")
+        self.window.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         self.create_widgets()
 
+        unmigrated = self.library.get_unmigrated_books()
+        if unmigrated:
+            titles = "\n".join(f"{row[1]} by {row[2]} (ISBN {row[3]})" for row in unmigrated)
+            if messagebox.askyesno("ISBN Migration",
+                                   f"{len(unmigrated)} book(s) have an invalid or duplicate ISBN and are hidden "
+                                   f"from the catalog:\n\n{titles}\n\nCorrect their ISBNs now?", icon="warning"):
+                self.restore_unmigrated_dialog()
+
     def create_widgets(self):
         original_image = Image.open("ks.png")
         resized_image = original_image.resize((1495, 200), Image.LANCZOS)
@@ -461,12 +853,22 @@ class LibraryApp:
         self.create_button(button_frame, "Upload PDF", self.upload_pdf, 1, 1)
         self.create_button(button_frame, "View PDF", self.view_pdf, 2, 0)
         self.create_button(button_frame, "Update Book", self.update_book, 2, 1)
+        self.create_button(button_frame, "Check Out Book", self.checkout_book, 3, 0)
+        self.create_button(button_frame, "Check In Book", self.checkin_book, 3, 1)
+        self.create_button(button_frame, "Overdue Books", self.view_overdue, 4, 0)
+        self.create_button(button_frame, "Member Loans", self.view_member_loans, 4, 1)
         undo_button = tk.Button(button_frame, text="Undo Last Operation", command=self.library.undo, width=20,
                                 bg="#007bff", fg="white", font=("Helvetica", 14))
-        undo_button.grid(row=3, column=0, columnspan=2, padx=20, pady=10)
-        exit_button = tk.Button(button_frame, text="Exit", command=self.window.quit, width=20, bg="#ff4d4d", fg="white",
+        undo_button.grid(row=5, column=0, columnspan=2, padx=20, pady=10)
+        exit_button = tk.Button(button_frame, text="Exit", command=self.exit_app, width=20, bg="#ff4d4d", fg="white",
                                 font=("Helvetica", 14))
-        exit_button.grid(row=4, column=0, columnspan=2, padx=20, pady=20)
+        exit_button.grid(row=6, column=0, columnspan=2, padx=20, pady=20)
+
+    def exit_app(self):
+        if not self.circulation.flush():
+            if not messagebox.askyesno("Exit", "Some loan changes could not be saved and will be lost. Exit anyway?"):
+                return
+        self.window.quit()
 
     def create_button(self, parent, text, command, row, column):
         button = tk.Button(parent, text=text, command=command, width=20, bg="#007bff", fg="white", font=("Helvetica", 14))
@@ -474,6 +876,70 @@ class LibraryApp:
         button.bind("<Enter>", lambda e: button.config(bg="#0056b3"))
         button.bind("<Leave>", lambda e: button.config(bg="#007bff"))
 
+    def validate_isbn_input(self, P):
+        if all(c.isdigit() or c in "-Xx " for c in P):
+            return True
+        else:
+            return False
+
+    def restore_unmigrated_dialog(self):
+        restore_window = tk.Toplevel(self.window)
+        restore_window.title("Correct ISBNs")
+        restore_window.geometry("600x450")
+        restore_window.config(bg="#f0f0f0")
+
+        tk.Label(restore_window, text="Books with an invalid or duplicate ISBN:", bg="#f0f0f0").pack(pady=5)
+        book_list = tk.Listbox(restore_window, width=80, height=10)
+        book_list.pack(pady=5)
+
+        rows = []
+
+        def refresh():
+            rows[:] = self.library.get_unmigrated_books()
+            book_list.delete(0, tk.END)
+            for row in rows:
+                book_list.insert(tk.END, f"{row[1]} by {row[2]} (ISBN {row[3]})")
+
+        refresh()
+
+        tk.Label(restore_window, text="Corrected ISBN-10 or ISBN-13:", bg="#f0f0f0").pack(pady=5)
+        validate_isbn = restore_window.register(self.validate_isbn_input)
+        isbn_entry = tk.Entry(restore_window, width=30, validate="key", validatecommand=(validate_isbn, '%P'))
+        isbn_entry.pack(pady=5)
+
+        def on_restore():
+            selection = book_list.curselection()
+            isbn = isbn_entry.get()
+            if not selection or not isbn:
+                messagebox.showwarning("Input Error", "Select a book and enter its ISBN.")
+                return
+            if self.library.restore_unmigrated_book(rows[selection[0]][0], isbn):
+                isbn_entry.delete(0, tk.END)
+                refresh()
+                if not rows:
+                    restore_window.destroy()
+
+        def on_discard():
+            selection = book_list.curselection()
+            if not selection:
+                messagebox.showwarning("Input Error", "Select a book to discard.")
+                return
+            row = rows[selection[0]]
+            if messagebox.askyesno("Discard", f'Permanently discard "{row[1]}" (ISBN {row[3]})?'):
+                self.library.discard_unmigrated_book(row[0])
+                refresh()
+                if not rows:
+                    restore_window.destroy()
+
+        restore_button = tk.Button(restore_window, text="Restore", command=on_restore, bg="#007bff", fg="white")
+        restore_button.pack(pady=20)
+
+        discard_button = tk.Button(restore_window, text="Discard", command=on_discard, bg="#ff4d4d", fg="white")
+        discard_button.pack(pady=5)
+
+        close_button = tk.Button(restore_window, text="Close", command=restore_window.destroy, bg="#ff4d4d", fg="white")
+        close_button.pack(pady=5)
+
     def add_book(self):
         add_book_window = tk.Toplevel(self.window)
         add_book_window.title("Add Book")
@@ -488,15 +954,9 @@ class LibraryApp:
         author_entry = tk.Entry(add_book_window, width=30)
         author_entry.pack(pady=5)
 
-        tk.Label(add_book_window, text="ISBN (numbers only):", bg="#f0f0f0").pack(pady=5)
-
-        def validate_isbn_input(P):
-            if P == "" or P.isdigit():
-                return True
-            else:
-                return False
+        tk.Label(add_book_window, text="ISBN-10 or ISBN-13:", bg="#f0f0f0").pack(pady=5)
 
-        validate_isbn = add_book_window.register(validate_isbn_input)
+        validate_isbn = add_book_window.register(self.validate_isbn_input)
 
         isbn_entry = tk.Entry(add_book_window, width=30, validate="key", validatecommand=(validate_isbn, '%P'))
         isbn_entry.pack(pady=5)
@@ -530,6 +990,49 @@ class LibraryApp:
         if isbn:
             self.library.view_pdf(isbn)
 
+    def checkout_book(self):
+        isbn = simpledialog.askstring("Input", "Enter book ISBN to check out:")
+        if not isbn:
+            return
+        member_id = simpledialog.askstring("Input", "Enter member ID:")
+        if member_id:
+            loan = self.circulation.checkout(isbn, member_id)
+            if loan:
+                messagebox.showinfo("Success", f'Book with ISBN "{loan.isbn}" checked out to {member_id}, '
+                                               f'due {time.strftime("%Y-%m-%d", time.localtime(loan.due_time))}.')
+
+    def checkin_book(self):
+        isbn = simpledialog.askstring("Input", "Enter book ISBN to check in:")
+        if isbn:
+            loan = self.circulation.checkin(isbn)
+            if loan:
+                messagebox.showinfo("Success", f'Book with ISBN "{loan.isbn}" checked in from {loan.member_id}.')
+
+    def describe_loans(self, loans):
+        lines = []
+        for loan in loans:
+            book = self.library.book_index.get(loan.isbn)
+            title = book.title if book else "Unknown title"
+            due = time.strftime("%Y-%m-%d", time.localtime(loan.due_time))
+            lines.append(f"{title} ({loan.isbn}) - {loan.member_id}, due {due}")
+        return "\n".join(lines)
+
+    def view_overdue(self):
+        loans = self.circulation.overdue_loans()
+        if loans:
+            messagebox.showinfo("Overdue Books", self.describe_loans(loans))
+        else:
+            messagebox.showinfo("Overdue Books", "No overdue books.")
+
+    def view_member_loans(self):
+        member_id = simpledialog.askstring("Input", "Enter member ID:")
+        if member_id:
+            loans = self.circulation.loans_for_member(member_id)
+            if loans:
+                messagebox.showinfo("Member Loans", self.describe_loans(loans))
+            else:
+                messagebox.showinfo("Member Loans", f"{member_id} has no books checked out.")
+
     def update_book(self):
         isbn = simpledialog.askstring ("Input", "Enter book ISBN to update:")
         if isbn:
@@ -555,15 +1058,9 @@ class LibraryApp:
         author_entry.insert(0, book[1])
         author_entry.pack(pady=5)
 
-        tk.Label(update_book_window, text="ISBN (numbers only):", bg="#f0f0f0").pack(pady=5)
-
-        def validate_isbn_input(P):
-            if P == "" or P.isdigit():
-                return True
-            else:
-                return False
+        tk.Label(update_book_window, text="ISBN-10 or ISBN-13:", bg="#f0f0f0").pack(pady=5)
 
-        validate_isbn = update_book_window.register(validate_isbn_input)
+        validate_isbn = update_book_window.register(self.validate_isbn_input)
 
         isbn_entry = tk.Entry(update_book_window, width=30, validate="key", validatecommand=(validate_isbn, '%P'))
         isbn_entry.insert(0, book[2])
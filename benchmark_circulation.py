@@ -0,0 +1,89 @@
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from Final import Circulation, Library
+from benchmark_isbn import make_isbn13
+
+BOOK_COUNT = 20000
+MEMBER_COUNT = 2000
+TRANSACTION_COUNT = 100000
+OVERDUE_CHECK_EVERY = 500
+
+
+def build_catalog(path, isbns):
+    Library(path)
+    conn = sqlite3.connect(path)
+    conn.executemany("INSERT INTO books (title, author, isbn) VALUES (?, ?, ?)",
+                     ((f"Title {i}", f"Author {i}", int(isbn)) for i, isbn in enumerate(isbns)))
+    conn.commit()
+    conn.close()
+
+
+def run_desk(path, batch_size, seed=7):
+    # A busy desk: one transaction every ~30 simulated seconds. Checkouts are
+    # as likely as the share of books on the shelf, so about half the
+    # catalog stays on loan and old loans drift past their due date.
+    rng = random.Random(seed)
+    library = Library(path)
+    library.load_books_from_db()
+    circulation = Circulation(library, batch_size=batch_size)
+
+    on_shelf = list(library.book_index)
+    on_loan = []
+    now = time.time()
+    overdue_time = 0.0
+    overdue_checks = 0
+    overdue_found = 0
+
+    start = time.perf_counter()
+    for i in range(TRANSACTION_COUNT):
+        now += rng.uniform(0, 60)
+        if rng.random() < len(on_shelf) / len(library.book_index):
+            slot = rng.randrange(len(on_shelf))
+            on_shelf[slot], on_shelf[-1] = on_shelf[-1], on_shelf[slot]
+            isbn = on_shelf.pop()
+            circulation.checkout(isbn, f"M{rng.randrange(MEMBER_COUNT)}", now)
+            on_loan.append(isbn)
+        else:
+            slot = rng.randrange(len(on_loan))
+            on_loan[slot], on_loan[-1] = on_loan[-1], on_loan[slot]
+            isbn = on_loan.pop()
+            circulation.checkin(isbn, now)
+            on_shelf.append(isbn)
+
+        if i % OVERDUE_CHECK_EVERY == 0:
+            query_start = time.perf_counter()
+            overdue_found += len(circulation.overdue_loans(now))
+            overdue_time += time.perf_counter() - query_start
+            overdue_checks += 1
+    circulation.flush()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "tps": TRANSACTION_COUNT / elapsed,
+        "active": len(circulation.active_loans),
+        "overdue_us": overdue_time / overdue_checks * 1e6,
+        "overdue_avg": overdue_found / overdue_checks,
+    }
+
+
+def main():
+    rng = random.Random(42)
+    isbns = list({make_isbn13(rng) for _ in range(BOOK_COUNT)})
+
+    print(f"{len(isbns)} books, {MEMBER_COUNT} members, {TRANSACTION_COUNT} transactions")
+    print(f"{'batch size':<12}{'txn/s':>12}{'active loans':>14}{'overdue query (us)':>20}{'avg overdue':>13}")
+    for batch_size in (1, 10, 100, 1000):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "library_management.db")
+            build_catalog(path, isbns)
+            result = run_desk(path, batch_size)
+        print(f"{batch_size:<12}{result['tps']:>12.0f}{result['active']:>14}"
+              f"{result['overdue_us']:>20.1f}{result['overdue_avg']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from Final import Library, normalize_isbn
+
+BOOK_COUNT = 100000
+LOOKUP_COUNT = 20000
+
+
+def make_isbn13(rng):
+    digits = "978" + "".join(str(rng.randrange(10)) for _ in range(9))
+    return digits + str(-sum((3 if i % 2 else 1) * int(d) for i, d in enumerate(digits)) % 10)
+
+
+def build_text_db(path, isbns):
+    # The books schema as it was before ISBNs became integer keys.
+    conn = sqlite3.connect(path)
+    conn.execute('''
+    CREATE TABLE books (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT NOT NULL,
+        isbn TEXT NOT NULL UNIQUE,
+        pdf_path TEXT
+    );
+    ''')
+    conn.executemany("INSERT INTO books (title, author, isbn) VALUES (?, ?, ?)",
+                     ((f"Title {i}", f"Author {i}", isbn) for i, isbn in enumerate(isbns)))
+    conn.commit()
+    conn.close()
+
+
+def index_size(path):
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM")
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='books'")
+    index_name = cursor.fetchone()[0]
+    cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name=?", (index_name,))
+    size = cursor.fetchone()[0]
+    conn.close()
+    return size
+
+
+def lookup_latency(path, keys):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    start = time.perf_counter()
+    for key in keys:
+        cursor.execute("SELECT title, author, isbn FROM books WHERE isbn=?", (key,))
+        cursor.fetchone()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed / len(keys) * 1e6
+
+
+def main():
+    rng = random.Random(42)
+    isbns = list({make_isbn13(rng) for _ in range(BOOK_COUNT)})
+    lookups = [rng.choice(isbns) for _ in range(LOOKUP_COUNT)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library_management.db")
+        build_text_db(path, isbns)
+        text_size = index_size(path)
+        text_latency = lookup_latency(path, lookups)
+
+        start = time.perf_counter()
+        library = Library(path)
+        migration_time = time.perf_counter() - start
+
+        int_size = index_size(path)
+        int_latency = lookup_latency(path, [normalize_isbn(isbn) for isbn in lookups])
+
+    print(f"{len(isbns)} books, {LOOKUP_COUNT} lookups, migration {migration_time:.2f}s "
+          f"({library.unmigrated_books} unmigrated)")
+    print(f"{'isbn key':<10}{'index size (KiB)':>18}{'lookup (us)':>14}")
+    print(f"{'TEXT':<10}{text_size / 1024:>18.1f}{text_latency:>14.2f}")
+    print(f"{'INTEGER':<10}{int_size / 1024:>18.1f}{int_latency:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()